@@ -61,6 +61,13 @@ IMAGE_META_HEADERS = ['x-image-meta-location', 'x-image-meta-size',
                       'x-image-meta-store', 'x-image-meta-id',
                       'x-image-meta-protected', 'x-image-meta-deleted']
 
+IMAGE_META_PREFIX = 'x-image-meta-'
+IMAGE_META_PROPERTY_PREFIX = 'x-image-meta-property-'
+
+# Field names allowed by IMAGE_META_HEADERS, for constant-time lookups
+_IMAGE_META_FIELDS = frozenset(h[len(IMAGE_META_PREFIX):]
+                               for h in IMAGE_META_HEADERS)
+
 GLANCE_TEST_SOCKET_FD_STR = 'GLANCE_TEST_SOCKET_FD'
 
 
@@ -199,15 +206,15 @@ def image_meta_to_http_headers(image_meta):
     :param image_meta: Mapping of image metadata
     """
     headers = {}
-    for k, v in image_meta.items():
-        if v is not None:
-            if k == 'properties':
-                for pk, pv in v.items():
-                    if pv is not None:
-                        headers["x-image-meta-property-%s"
-                                % pk.lower()] = unicode(pv)
-            else:
-                headers["x-image-meta-%s" % k.lower()] = unicode(v)
+    for k, v in image_meta.iteritems():
+        if v is None:
+            continue
+        if k == 'properties':
+            headers.update((IMAGE_META_PROPERTY_PREFIX + pk.lower(),
+                            unicode(pv))
+                           for pk, pv in v.iteritems() if pv is not None)
+        else:
+            headers[IMAGE_META_PREFIX + k.lower()] = unicode(v)
     return headers
 
 
@@ -242,14 +249,20 @@ def get_image_meta_from_headers(response):
     else:  # webob.Response
         headers = response.headers.items()
 
+    meta_prefix_len = len(IMAGE_META_PREFIX)
+    property_prefix_len = len(IMAGE_META_PROPERTY_PREFIX)
     for key, value in headers:
         key = str(key.lower())
-        if key.startswith('x-image-meta-property-'):
-            field_name = key[len('x-image-meta-property-'):].replace('-', '_')
+        # Most headers are not image metadata, so rule them out with a
+        # single prefix check before looking for properties.
+        if not key.startswith(IMAGE_META_PREFIX):
+            continue
+        if key.startswith(IMAGE_META_PROPERTY_PREFIX):
+            field_name = key[property_prefix_len:].replace('-', '_')
             properties[field_name] = value or None
-        elif key.startswith('x-image-meta-'):
-            field_name = key[len('x-image-meta-'):].replace('-', '_')
-            if 'x-image-meta-' + field_name not in IMAGE_META_HEADERS:
+        else:
+            field_name = key[meta_prefix_len:].replace('-', '_')
+            if field_name not in _IMAGE_META_FIELDS:
                 msg = _("Bad header: %(header_name)s") % {'header_name': key}
                 raise exc.HTTPBadRequest(msg, content_type="text/plain")
             result[field_name] = value or None
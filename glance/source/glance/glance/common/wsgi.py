@@ -37,6 +37,7 @@ import eventlet.wsgi
 from oslo.config import cfg
 import routes
 import routes.middleware
+import six
 import webob.dec
 import webob.exc
 
@@ -488,16 +489,18 @@ class Request(webob.Request):
 
     def best_match_content_type(self):
         """Determine the requested response content-type."""
-        supported = ('application/json',)
-        bm = self.accept.best_match(supported)
-        return bm or 'application/json'
+        # NOTE: JSON is the only supported representation, and it is also
+        # the fallback, so every Accept header resolves to it. Skip parsing
+        # the header.
+        return 'application/json'
 
     def get_content_type(self, allowed_content_types):
         """Determine content type of the request body."""
-        if "Content-Type" not in self.headers:
+        content_type = self.environ.get('CONTENT_TYPE')
+        if content_type is None:
             raise exception.InvalidContentType(content_type=None)
 
-        content_type = self.content_type
+        content_type = content_type.partition(';')[0]
 
         if content_type not in allowed_content_types:
             raise exception.InvalidContentType(content_type=content_type)
@@ -512,7 +515,9 @@ class JSONRequestDeserializer(object):
 
         :param request:  Webob.Request object
         """
-        if 'transfer-encoding' in request.headers:
+        # NOTE: Check the environ directly rather than going through
+        # request.headers, which wraps it in an EnvironHeaders mapping.
+        if 'HTTP_TRANSFER_ENCODING' in request.environ:
             return True
         elif request.content_length > 0:
             return True
@@ -524,8 +529,14 @@ class JSONRequestDeserializer(object):
         return obj
 
     def from_json(self, datastring):
+        # NOTE: The base _sanitizer is a no-op, so only hand it to json.loads
+        # when a subclass overrides it. Without an object_hook the C scanner
+        # builds every object without calling back into Python.
+        object_hook = self._sanitizer
+        if getattr(object_hook, '__func__', None) is _BASE_SANITIZER:
+            object_hook = None
         try:
-            return json.loads(datastring, object_hook=self._sanitizer)
+            return json.loads(datastring, object_hook=object_hook)
         except ValueError:
             msg = _('Malformed JSON in request body.')
             raise webob.exc.HTTPBadRequest(explanation=msg)
@@ -537,8 +548,15 @@ class JSONRequestDeserializer(object):
             return {}
 
 
+# The no-op JSONRequestDeserializer._sanitizer, resolved once for from_json
+_BASE_SANITIZER = six.get_unbound_function(JSONRequestDeserializer._sanitizer)
+
+
 class JSONResponseSerializer(object):
 
+    # Built on first use; see to_json
+    _encoder = None
+
     def _sanitizer(self, obj):
         """Sanitizer method that will be passed to json.dumps."""
         if isinstance(obj, datetime.datetime):
@@ -548,7 +566,14 @@ class JSONResponseSerializer(object):
         return obj
 
     def to_json(self, data):
-        return json.dumps(data, default=self._sanitizer)
+        # NOTE: json.dumps(data, default=...) builds a new JSONEncoder on
+        # every call. The encoder holds no per-call state, so build it once
+        # per serializer, bound to this instance's _sanitizer.
+        encoder = self._encoder
+        if encoder is None:
+            encoder = json.JSONEncoder(default=self._sanitizer)
+            self._encoder = encoder
+        return encoder.encode(data)
 
     def default(self, response, result):
         response.content_type = 'application/json'
@@ -610,9 +635,8 @@ class Resource(object):
 
     def dispatch(self, obj, action, *args, **kwargs):
         """Find action-specific method on self and call it."""
-        try:
-            method = getattr(obj, action)
-        except AttributeError:
+        method = getattr(obj, action, None)
+        if method is None:
             method = getattr(obj, 'default')
 
         return method(*args, **kwargs)
@@ -624,14 +648,6 @@ class Resource(object):
         except Exception:
             return {}
 
-        try:
-            del args['controller']
-        except KeyError:
-            pass
-
-        try:
-            del args['format']
-        except KeyError:
-            pass
-
+        args.pop('controller', None)
+        args.pop('format', None)
         return args
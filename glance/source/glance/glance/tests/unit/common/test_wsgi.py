@@ -16,7 +16,8 @@
 #    under the License.
 
 import datetime
-import eventlet.patcher
+import eventlet.greenpool
+import json
 import webob
 
 from glance.common import exception
@@ -195,8 +196,8 @@ class JSONResponseSerializerTest(test_utils.BaseTestCase):
         response = webob.Response()
         wsgi.JSONResponseSerializer().default(response, fixture)
         self.assertEqual(response.status_int, 200)
-        content_types = filter(lambda h: h[0] == 'Content-Type',
-                               response.headerlist)
+        content_types = [h for h in response.headerlist
+                         if h[0] == 'Content-Type']
         self.assertEqual(len(content_types), 1)
         self.assertEqual(response.content_type, 'application/json')
         self.assertEqual(response.body, '{"key": "value"}')
@@ -235,6 +236,31 @@ class JSONRequestDeserializerTest(test_utils.BaseTestCase):
         actual = wsgi.JSONRequestDeserializer().from_json(fixture)
         self.assertEqual(actual, expected)
 
+    def test_from_json_no_object_hook_by_default(self):
+        kwargs = {}
+        real_loads = json.loads
+
+        def fake_loads(datastring, **kw):
+            kwargs.update(kw)
+            return real_loads(datastring, **kw)
+
+        self.stubs.Set(wsgi.json, 'loads', fake_loads)
+        actual = wsgi.JSONRequestDeserializer().from_json('{"key": "value"}')
+        self.assertEqual(actual, {"key": "value"})
+        self.assertIsNone(kwargs['object_hook'])
+
+    def test_from_json_with_sanitizer_override(self):
+        class Deserializer(wsgi.JSONRequestDeserializer):
+            def _sanitizer(self, obj):
+                obj['sanitized'] = True
+                return obj
+
+        fixture = '{"key": {"nested": 1}}'
+        expected = {"key": {"nested": 1, "sanitized": True},
+                    "sanitized": True}
+        actual = Deserializer().from_json(fixture)
+        self.assertEqual(actual, expected)
+
     def test_from_json_malformed(self):
         fixture = 'kjasdklfjsklajf'
         self.assertRaises(webob.exc.HTTPBadRequest,